@@ -17,23 +17,900 @@ How it works:
 Author: Matthew R. DeVerna
 """
 
+import asyncio
+import hashlib
 import os
 import sys
+import threading
+import time
 
-# Add 'lib' directory to sys.path to load dependencies
-sys.path.append(os.path.join(os.path.dirname(__file__), "lib"))
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+# Add 'lib' directory to sys.path to load dependencies (once, as the script
+# is re-executed on every rerun)
+lib_path = os.path.join(os.path.dirname(__file__), "lib")
+if lib_path not in sys.path:
+    sys.path.insert(0, lib_path)
 
 # Internal
-from helpers.google import grounded_generation
-from helpers.serp import get_search_results
 from helpers.gnews import get_recent_articles, sample_articles
-from helpers.utils import update_response_text, organic_search_to_markdown
+from helpers.utils import update_response_text
 
 # External
-from google import genai
-from serpapi import GoogleSearch
-
+import pandas as pd
+import requests
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Request timeouts (seconds) so a hung connection fails fast instead of
+# leaving the spinner running indefinitely
+VALIDATION_TIMEOUT = 10
+SEARCH_TIMEOUT = 30
+
+# How often (seconds) in-flight searches are checked for results
+POLL_INTERVAL = 0.5
+
+GEMINI_MODEL = "gemini-2.0-flash"
+
+
+# The Google and SERP SDKs are heavy, so they are only imported once needed
+@st.cache_resource(show_spinner=False)
+def _get_genai():
+    """
+    Lazily import the Google GenAI SDK.
+
+    Returns
+    -------
+    module
+        The `google.genai` module, with `google.genai.types` loaded.
+    """
+    from google import genai
+    from google.genai import types  # noqa: F401 (loads genai.types)
+
+    return genai
+
+
+@st.cache_resource(show_spinner=False)
+def _get_serp():
+    """
+    Lazily import the SERP API client.
+
+    Returns
+    -------
+    type
+        The `serpapi.GoogleSearch` class.
+    """
+    from serpapi import GoogleSearch
+
+    return GoogleSearch
+
+
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def get_genai_client(api_key):
+    """
+    Create and validate a Google client, built once per API key so reruns
+    skip client setup and the validation request.
+
+    The pinned google-genai (1.2.0) opens a new HTTP session per request, so
+    caching the client does not reuse connections. Failed validations raise
+    and are therefore not cached. Entries expire after an hour, and only the
+    most recent keys are kept, so revoked or rotated keys are re-checked and
+    the cache stays bounded.
+
+    Parameters
+    ----------
+    api_key : str
+        The Google API key.
+
+    Returns
+    -------
+    google.genai.Client
+        A validated Google client.
+    """
+    # The client is reused for searches, so it gets the longer timeout (ms)
+    genai = _get_genai()
+    google_client = genai.Client(
+        api_key=api_key, http_options={"timeout": SEARCH_TIMEOUT * 1000}
+    )
+    # Test the API key by looking up the one model we use, which is much
+    # cheaper than listing every model. The probes get the shorter validation
+    # timeout (ms) rather than the client's search timeout.
+    probe_config = {"http_options": {"timeout": VALIDATION_TIMEOUT * 1000}}
+    try:
+        google_client.models.get(model=GEMINI_MODEL, config=probe_config)
+    except Exception:
+        # Fall back to the full list, whose error is more descriptive
+        google_client.models.list(config=probe_config)
+    return google_client
+
+
+def _validate_google(api_key):
+    """
+    Create a Google client and validate the API key.
+
+    Parameters
+    ----------
+    api_key : str
+        The Google API key to validate.
+
+    Returns
+    -------
+    tuple[bool, google.genai.Client | Exception]
+        Whether validation succeeded, and either the client or the raised error.
+    """
+    try:
+        return True, get_genai_client(api_key)
+    except Exception as e:
+        return False, e
+
+
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def validate_serp(api_key):
+    """
+    Validate a SERP API key, once per key.
+
+    The key is passed with the request rather than set on the shared
+    `GoogleSearch` class, so concurrent sessions don't overwrite each other's
+    keys. Rejected keys raise (including when SerpApi returns an error body
+    instead of failing the request), so only valid keys are cached, and each
+    result expires after an hour so revoked keys are re-checked.
+
+    Parameters
+    ----------
+    api_key : str
+        The SERP API key to validate.
+
+    Returns
+    -------
+    bool
+        True if the key is valid.
+    """
+    GoogleSearch = _get_serp()
+    # Test the API key by making a simple request
+    search = GoogleSearch({"api_key": api_key})
+    search.timeout = VALIDATION_TIMEOUT
+    account = search.get_account()
+    # SerpApi reports a bad key in the response body rather than raising
+    if "error" in account:
+        raise ValueError(account["error"])
+    return True
+
+
+def _validate_serp(api_key):
+    """
+    Validate the SERP API key.
+
+    Parameters
+    ----------
+    api_key : str
+        The SERP API key to validate.
+
+    Returns
+    -------
+    tuple[bool, None | Exception]
+        Whether validation succeeded, and None or the raised error.
+    """
+    try:
+        return validate_serp(api_key), None
+    except Exception as e:
+        return False, e
+
+
+def _key_hash(api_key):
+    """
+    Hash an API key so validated keys can be tracked without storing them.
+
+    Parameters
+    ----------
+    api_key : str
+        The API key to hash.
+
+    Returns
+    -------
+    str
+        The hex digest of the SHA-256 hash of the key.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_recent_articles():
+    """
+    Retrieve recent Google News articles, cached for ten minutes.
+
+    Sampling is left to the caller so each "Fetch" click still reshuffles
+    the articles shown. Callers clear the cache when no articles come back.
+
+    Returns
+    -------
+    list[dict]
+        Recent articles, as returned by `get_recent_articles`.
+    """
+    return get_recent_articles()
+
+
+def _search_params(query, location, api_key):
+    """
+    Build the SERP API query parameters for a Google search.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str | None
+        The location to search from. Omitted from the parameters if not set.
+    api_key : str
+        The SERP API key.
+
+    Returns
+    -------
+    dict
+        The SERP API query parameters.
+    """
+    params = {"engine": "google", "q": query, "api_key": api_key}
+    if location:
+        params["location"] = location
+    return params
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_search_results(query, location, _serp_api_key):
+    """
+    Retrieve Google Search results from the SERP API, cached for one hour.
+
+    Errors reported by SerpApi raise a `ValueError` and are not cached.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str
+        The location to search from.
+    _serp_api_key : str
+        The SERP API key. The leading underscore excludes it from the cache key.
+
+    Returns
+    -------
+    dict
+        The search results.
+    """
+    GoogleSearch = _get_serp()
+    search = GoogleSearch(_search_params(query, location, _serp_api_key))
+    # The client's default timeout is 60000 s, so set a real one to free the
+    # worker (and this function's cache lock) if SerpApi hangs
+    search.timeout = SEARCH_TIMEOUT
+    search_results = search.get_dict()
+    # Raise on SerpApi error bodies (e.g., a bad location or no credits left)
+    # so they are shown to the user and not cached
+    if "error" in search_results:
+        raise ValueError(search_results["error"])
+    return search_results
+
+
+SERP_API_URL = "https://serpapi.com/search.json"
+
+
+async def _fetch(session, params):
+    """
+    Fetch a single set of search results from the SERP API.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        An open session used to make the request.
+    params : dict
+        The SERP API query parameters, including the API key.
+
+    Returns
+    -------
+    dict
+        The search results.
+    """
+    async with session.get(SERP_API_URL, params=params) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def fetch_many(query, location, api_key, starts):
+    """
+    Fetch several pages of search results for a query concurrently.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str | None
+        The location to search from. Omitted from the request if not set.
+    api_key : str
+        A validated SERP API key.
+    starts : list[int]
+        The result offset of each page to fetch (e.g., 0, 10, 20).
+
+    Returns
+    -------
+    list[dict]
+        The search results, one page per offset in `starts`.
+    """
+    import aiohttp
+
+    params = _search_params(query, location, api_key)
+    timeout = aiohttp.ClientTimeout(total=SEARCH_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        tasks = [_fetch(session, {**params, "start": start}) for start in starts]
+        return await asyncio.gather(*tasks)
+
+
+def get_search_results_batch(query, location, api_key, starts):
+    """
+    Synchronous wrapper around `fetch_many`, for fetching several pages of
+    results at once.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str | None
+        The location to search from. Omitted from the request if not set.
+    api_key : str
+        A validated SERP API key.
+    starts : list[int]
+        The result offset of each page to fetch (e.g., 0, 10, 20).
+
+    Returns
+    -------
+    list[dict]
+        The search results, one page per offset in `starts`.
+    """
+    return asyncio.run(fetch_many(query, location, api_key, starts))
+
+
+@st.cache_resource
+def get_executor():
+    """
+    Thread pool shared by all sessions and reruns for background API calls.
+
+    Returns
+    -------
+    concurrent.futures.ThreadPoolExecutor
+        The shared thread pool, which also caps concurrent API requests.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="qm")
+
+
+def submit_with_ctx(executor, fn, *args):
+    """
+    Submit work to a thread pool with the current script run context attached.
+
+    The `st.cache_*` functions run in the pool expect a `ScriptRunContext` on
+    their thread, and otherwise log a "missing ScriptRunContext" warning.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.ThreadPoolExecutor
+        The pool to submit to.
+    fn : callable
+        The function to run.
+    *args
+        Positional arguments for `fn`.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        A future resolving to the return value of `fn`.
+    """
+    ctx = get_script_run_ctx()
+
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+
+    return executor.submit(run)
+
+
+@st.cache_resource
+def get_validation_executor():
+    """
+    Small thread pool reserved for API key validation, so slow searches in the
+    shared pool can't hold up new sessions at key setup.
+
+    Returns
+    -------
+    concurrent.futures.ThreadPoolExecutor
+        The validation thread pool.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="qm_validate")
+
+
+def _validation_result(future):
+    """
+    Wait a bounded time for a validation submitted to the validation pool.
+
+    Parameters
+    ----------
+    future : concurrent.futures.Future
+        A future from `_validate_google` or `_validate_serp`.
+
+    Returns
+    -------
+    tuple[bool, object]
+        The validation result, or a failure carrying a timeout error.
+    """
+    try:
+        # Leave a little slack over the request timeout for client setup
+        return future.result(timeout=VALIDATION_TIMEOUT + 5)
+    except FuturesTimeoutError:
+        return False, TimeoutError("Validation timed out, please retry.")
+
+
+def prefetch_search_results(query, location, serp_api_key):
+    """
+    Start fetching search results in the background, reusing the in-flight
+    request if the query and location have not changed since the last rerun.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str
+        The location to search from.
+    serp_api_key : str
+        A validated SERP API key.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        A future resolving to the search results.
+    """
+    search_key = (query, location)
+    pending_future = st.session_state.get("pending_future")
+    # Consumed on every call so a stale click can't retry a later search
+    retry = st.session_state.pop("retry_search", False)
+    if pending_future is not None and st.session_state.pending_search == search_key:
+        # Failed or timed out searches are only resubmitted when the user
+        # clicks "Retry", so other reruns keep showing the error
+        if pending_future.done():
+            failed = (
+                pending_future.cancelled() or pending_future.exception() is not None
+            )
+        else:
+            elapsed = time.monotonic() - st.session_state.pending_started
+            failed = elapsed >= SEARCH_TIMEOUT
+        if not (failed and retry):
+            return pending_future
+
+    # The search changed, so drop the stale request if it hasn't started yet
+    if pending_future is not None:
+        pending_future.cancel()
+
+    pending_future = submit_with_ctx(
+        get_executor(), fetch_search_results, query, location, serp_api_key
+    )
+    st.session_state.pending_future = pending_future
+    st.session_state.pending_search = search_key
+    st.session_state.pending_started = time.monotonic()
+    return pending_future
+
+
+def stream_grounded_generation(client, model, prompt, streamed_chunks):
+    """
+    Stream a Gemini response grounded in Google Search results.
+
+    Parameters
+    ----------
+    client : google.genai.Client
+        A validated Google client.
+    model : str
+        The Gemini model to use.
+    prompt : str
+        The prompt to send to the model.
+    streamed_chunks : list
+        Every response chunk is appended here so the grounding metadata, which
+        arrives with the final chunks, is available once the stream completes.
+
+    Yields
+    ------
+    str
+        The response text, piece by piece.
+    """
+    types = _get_genai().types
+    stream = client.models.generate_content_stream(
+        model=model,
+        contents=prompt,
+        config=types.GenerateContentConfig(
+            tools=[types.Tool(google_search=types.GoogleSearch())]
+        ),
+    )
+    for chunk in stream:
+        streamed_chunks.append(chunk)
+        if not chunk.candidates or not chunk.candidates[0].content:
+            continue
+        for part in chunk.candidates[0].content.parts or []:
+            if part.text:
+                yield part.text
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cite_response_text(
+    full_text, support_key, chunk_key, _grounding_supports, _grounding_chunks
+):
+    """
+    Cached wrapper around `update_response_text`.
+
+    The grounding objects can't be hashed by `st.cache_data`, so they are
+    passed with leading underscores and the cache is keyed on `support_key`
+    and `chunk_key` instead (see `_grounding_cache_keys`).
+
+    Parameters
+    ----------
+    full_text : str
+        The full text of the API response.
+    support_key : tuple[tuple[int, tuple[int]]]
+        The end index and chunk indices of each grounding support.
+    chunk_key : tuple[tuple[str, str]]
+        The URI and title of each grounding chunk.
+    _grounding_supports : list[google.genai.types.GroundingSupport]
+        Grounding support objects from Google Grounded search.
+    _grounding_chunks : list[google.genai.types.GroundingChunk]
+        Grounding chunk objects from Google Grounded search.
+
+    Returns
+    -------
+    str
+        The updated response text with markdown footnotes.
+    """
+    return update_response_text(full_text, _grounding_supports, _grounding_chunks)
+
+
+def _grounding_cache_keys(grounding_supports, grounding_chunks):
+    """
+    Build hashable cache keys from the fields `update_response_text` reads.
+
+    Parameters
+    ----------
+    grounding_supports : list[google.genai.types.GroundingSupport]
+        Grounding support objects from Google Grounded search.
+    grounding_chunks : list[google.genai.types.GroundingChunk]
+        Grounding chunk objects from Google Grounded search.
+
+    Returns
+    -------
+    tuple[tuple, tuple]
+        The support key and chunk key for `cite_response_text`.
+    """
+    support_key = tuple(
+        (support.segment.end_index, tuple(support.grounding_chunk_indices or ()))
+        for support in grounding_supports
+    )
+    chunk_key = tuple((chunk.web.uri, chunk.web.title) for chunk in grounding_chunks)
+    return support_key, chunk_key
+
+
+def render_conversational(google_client, query):
+    """
+    Render a Conversational search with Gemini, grounded in Google Search.
+
+    The response is streamed as it is generated and then replaced with the
+    same text annotated with cited sources.
+
+    Parameters
+    ----------
+    google_client : google.genai.Client
+        A validated Google client.
+    query : str
+        The search query.
+    """
+    # Reruns for the same query reuse the last response instead of
+    # regenerating it
+    last_response = st.session_state.get("last_response")
+    if last_response and last_response["query"] == query:
+        st.write(last_response["text"])
+        return
+
+    response_placeholder = st.empty()
+    streamed_chunks = []
+    try:
+        with response_placeholder:
+            full_text = st.write_stream(
+                stream_grounded_generation(
+                    google_client, GEMINI_MODEL, query, streamed_chunks
+                )
+            )
+
+        # Nothing to show (e.g., a safety block); `st.write_stream` returns an
+        # empty list rather than a string in that case
+        if not full_text:
+            response_placeholder.empty()
+            st.warning("No search results found. Please try again in a few moments.")
+            return
+
+        # Citations can only be added once the full response and metadata are in
+        grounding_metadata = None
+        for chunk in reversed(streamed_chunks):
+            if chunk.candidates and chunk.candidates[0].grounding_metadata:
+                grounding_metadata = chunk.candidates[0].grounding_metadata
+                break
+
+        updated_text = full_text
+        if grounding_metadata and grounding_metadata.grounding_supports:
+            grounding_supports = grounding_metadata.grounding_supports
+            grounding_chunks = grounding_metadata.grounding_chunks or []
+            updated_text = cite_response_text(
+                full_text,
+                *_grounding_cache_keys(grounding_supports, grounding_chunks),
+                grounding_supports,
+                grounding_chunks,
+            )
+            response_placeholder.write(updated_text)
+    except Exception as e:
+        # Leave `last_response` unset so the next attempt calls Gemini again
+        response_placeholder.empty()
+        if isinstance(e, requests.exceptions.Timeout):
+            st.error("Request timed out, please retry.")
+        else:
+            st.error(f"{e}")
+        return
+
+    st.session_state.last_response = {"query": query, "text": updated_text}
+
+
+# TODO: Implement
+def run_overview(query, location, serp_api_key):
+    """
+    Run an Overview search.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    location : str | None
+        The location to search from.
+    serp_api_key : str
+        A validated SERP API key.
+
+    Returns
+    -------
+    str
+        Placeholder text until this mode is implemented.
+    """
+    return "Nothing implemented here."
+
+
+def organic_search_to_df(results):
+    """
+    Convert SERP API organic search results into a dataframe.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Organic search results, each with 'position', 'title', 'link' and
+        (optionally) 'snippet' keys.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per result with columns 'position', 'title', 'link' and 'snippet'.
+    """
+    return pd.DataFrame(
+        [
+            {
+                "position": result.get("position"),
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+            }
+            for result in results
+        ],
+        columns=["position", "title", "link", "snippet"],
+    )
+
+
+def render_results(results):
+    """
+    Render the results of a search mode.
+
+    Parameters
+    ----------
+    results : str | pandas.DataFrame
+        Markdown text, or a dataframe of search results.
+    """
+    if isinstance(results, pd.DataFrame):
+        has_results = not results.empty
+    else:
+        has_results = bool(results)
+
+    if not has_results:
+        st.warning("No search results found. Please try again in a few moments.")
+    elif isinstance(results, pd.DataFrame):
+        # Dataframes are sent as compact Arrow payloads and rendered lazily
+        st.dataframe(
+            results,
+            column_config={"link": st.column_config.LinkColumn()},
+            hide_index=True,
+        )
+    else:
+        st.write(results)
+
+
+# TODO: Need to handle infinite scrolling via pagination
+def run_traditional(search_future):
+    """
+    Run a Traditional search, returning only organic Google Search results.
+
+    Parameters
+    ----------
+    search_future : concurrent.futures.Future
+        The search started by `prefetch_search_results`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The organic search results, one row per result.
+    """
+    search_results = search_future.result()
+    return organic_search_to_df(search_results.get("organic_results", []))
+
+
+def _search_pending():
+    """
+    Check whether any background search is still running and within its timeout.
+
+    Returns
+    -------
+    bool
+        True if results are still expected.
+    """
+    search_futures = st.session_state.get("search_futures")
+    if not search_futures:
+        return False
+    elapsed = time.monotonic() - st.session_state.search_started
+    return elapsed < SEARCH_TIMEOUT and not all(
+        future.done() for future in search_futures.values()
+    )
+
+
+def _request_retry():
+    """
+    Flag the failed search to be resubmitted by `prefetch_search_results`.
+    """
+    st.session_state.retry_search = True
+
+
+def _retry_button(mode):
+    """
+    Offer to retry a failed (or timed out) search.
+
+    Parameters
+    ----------
+    mode : str
+        The search mode that failed.
+    """
+    st.button("Retry", key=f"retry_{mode}", on_click=_request_retry)
+
+
+def render_search_results():
+    """
+    Render the background searches stashed in `st.session_state.search_futures`.
+
+    Finished searches are rendered, and those past `SEARCH_TIMEOUT` report a
+    timeout. Anything still in flight is left to `poll_search`.
+    """
+    search_futures = st.session_state.search_futures
+    elapsed = time.monotonic() - st.session_state.search_started
+
+    for mode, future in search_futures.items():
+        if future.done():
+            st.subheader(f"{mode} Search")
+            try:
+                results = run_traditional(future)
+            except Exception as e:
+                st.error(f"{e}")
+                _retry_button(mode)
+                continue
+            render_results(results)
+        elif elapsed >= SEARCH_TIMEOUT:
+            st.subheader(f"{mode} Search")
+            st.error("Request timed out, please retry.")
+            _retry_button(mode)
+
+
+@st.fragment(run_every=POLL_INTERVAL)
+def poll_search():
+    """
+    Show the progress of in-flight background searches.
+
+    `main` only registers this while a search is pending. An `st.status` shows
+    the elapsed time, and once the searches settle the app is rerun so
+    `search_panel` renders the results and the polling timer is dropped.
+    """
+    if _search_pending():
+        elapsed = time.monotonic() - st.session_state.search_started
+        st.status(f"Searching Google... ({elapsed:.1f}s)", expanded=False)
+    else:
+        st.rerun(scope="app")
+
+
+@st.fragment
+def search_panel(google_client, serp_api_key):
+    """
+    Render the search inputs and results.
+
+    As a fragment, this reruns on its own when its widgets change, without
+    re-running key validation or the article list above it.
+
+    Parameters
+    ----------
+    google_client : google.genai.Client
+        A validated Google client.
+    serp_api_key : str
+        A validated SERP API key.
+    """
+    st.divider()
+    st.subheader("Search")
+
+    # Select the search mode
+    search_mode = st.radio(
+        "Select search mode",
+        ["Conversational", "Overview", "Traditional"],
+    )
+
+    location = None
+    if search_mode in ["Overview", "Traditional"]:
+        location = st.text_input(
+            "Enter a location for the search",
+            help="Enter a city to mimic real search behavior.",
+        )
+
+    query = st.text_input(
+        "Enter a search query",
+        help="Use this as you would a normal Goole search.",
+    )
+
+    # Start the search now so it overlaps with rendering the rest of the page
+    search_future = None
+    if query and search_mode == "Traditional":
+        search_future = prefetch_search_results(query, location, serp_api_key)
+
+    st.divider()
+    if query:
+        st.subheader("Search Results")
+
+    # TODO: Need to allow conversation to continue
+    search_futures = {}
+    if query:
+        # Only one mode is selectable for now, but the selected modes are
+        # written so several could run together
+        selected_modes = [search_mode]
+
+        # Overview makes no requests yet, so it is rendered inline
+        if "Overview" in selected_modes:
+            st.subheader("Overview Search")
+            render_results(run_overview(query, location, serp_api_key))
+        if "Traditional" in selected_modes:
+            # Already running from the prefetch above
+            search_futures["Traditional"] = search_future
+
+        # Conversational results are streamed from this thread, as Streamlit
+        # elements can't be written from the pool
+        if "Conversational" in selected_modes:
+            st.subheader("Conversational Search")
+            render_conversational(google_client, query)
+
+    # Traditional searches run in the pool and are polled by `poll_search`, so
+    # the page stays responsive while requests are in flight
+    previous_futures = st.session_state.get("search_futures", {})
+    new_search = list(previous_futures.values()) != list(search_futures.values())
+    if new_search:
+        st.session_state.search_started = time.monotonic()
+    st.session_state.search_futures = search_futures
+
+    # The poller is only registered by a full app run, so start one for new
+    # searches submitted from a fragment rerun
+    if new_search and _search_pending():
+        st.rerun(scope="app")
+
+    if search_futures:
+        render_search_results()
 
 
 def main():
@@ -42,6 +919,13 @@ def main():
     """
     st.title("Welcome to QueryMode.")
 
+    # Hashes of keys already validated this session, used to skip re-validation
+    st.session_state.setdefault("validated_keys", {})
+    validated_keys = st.session_state.validated_keys
+
+    # Articles sampled by the last "Fetch" click
+    st.session_state.setdefault("sampled_articles", [])
+
     # Add app description
     st.markdown(
         """
@@ -67,28 +951,50 @@ def main():
     )
     serp_api_key = serp_api_key_place_holder.text_input("SERP API Key", type="password")
 
-    # Initialize Google client if API key is provided
+    # Validate both keys concurrently so we only wait on the slower request
     google_api_key_valid = False
     serp_api_key_valid = False
+    google_result = serp_result = None
+    google_hash = _key_hash(google_api_key) if google_api_key else None
+    serp_hash = _key_hash(serp_api_key) if serp_api_key else None
 
-    if google_api_key:
-        try:
-            google_client = genai.Client(api_key=google_api_key)
-            # Test the API key by making a simple request
-            google_client.models.list()
+    # Reuse previous validations from this session when the keys are unchanged
+    if google_hash and validated_keys.get("google") == google_hash:
+        google_result = (True, st.session_state.google_client)
+    if serp_hash and validated_keys.get("serp") == serp_hash:
+        serp_result = (True, None)
+
+    needs_google_check = google_api_key and google_result is None
+    needs_serp_check = serp_api_key and serp_result is None
+    if needs_google_check or needs_serp_check:
+        executor = get_validation_executor()
+        if needs_google_check:
+            google_future = submit_with_ctx(executor, _validate_google, google_api_key)
+        if needs_serp_check:
+            serp_future = submit_with_ctx(executor, _validate_serp, serp_api_key)
+        if needs_google_check:
+            google_result = _validation_result(google_future)
+        if needs_serp_check:
+            serp_result = _validation_result(serp_future)
+
+    # Initialize Google client if API key is provided
+    if google_result is not None:
+        google_api_key_valid, google_client_or_err = google_result
+        if google_api_key_valid:
+            st.session_state.google_client = google_client_or_err
+            validated_keys["google"] = google_hash
             st.success(
                 "**Google API successfully loaded and validated!**\n\n"
                 "To enter a new key, refresh the page."
             )
-            google_api_key_valid = True
             google_api_key_place_holder.empty()  # Clear the API key input box
 
-        except Exception as e:
+        else:
             st.warning(
                 "**Whoops! It looks like there was a problem.**\n\n"
                 "Please check the error message provided by Google below to troubleshoot."
             )
-            st.error(f"{e}")
+            st.error(f"{google_client_or_err}")
 
     else:
         st.warning(
@@ -98,25 +1004,22 @@ def main():
         )
 
     # Initialize SERP API client if API key is provided
-    if serp_api_key:
-        try:
-            GoogleSearch.SERP_API_KEY = serp_api_key
-            # Test the API key by making a simple request
-            search = GoogleSearch({})
-            search.get_account()
+    if serp_result is not None:
+        serp_api_key_valid, serp_err = serp_result
+        if serp_api_key_valid:
+            validated_keys["serp"] = serp_hash
             st.success(
                 "**SERP API successfully loaded and validated!**\n\n"
                 "To enter a new key, refresh the page."
             )
-            serp_api_key_valid = True
             serp_api_key_place_holder.empty()  # Clear the API key input box
 
-        except Exception as e:
+        else:
             st.warning(
                 "**Whoops! It looks like there was a problem.**\n\n"
                 "Please check the error message provided by SERP API below to troubleshoot."
             )
-            st.error(f"{e}")
+            st.error(f"{serp_err}")
 
     else:
         st.warning(
@@ -128,95 +1031,51 @@ def main():
     if not google_api_key_valid or not serp_api_key_valid:
         st.stop()
 
+    google_client = st.session_state.google_client
+
     # Retrieve recent articles
     st.divider()
     st.subheader("Fetch Google News headlines for search inspiration")
-    if st.button("Fetch"):
+    fetch_col, clear_col = st.columns(2)
+    with clear_col:
+        if st.button("Clear cache", help="Force the next fetch to pull new headlines."):
+            fetch_recent_articles.clear()
+    with fetch_col:
+        fetch_clicked = st.button("Fetch")
+    if fetch_clicked:
         with st.spinner("Fetching recent articles..."):
-            articles = get_recent_articles()
-            sampled_articles = sample_articles(articles)
+            articles = fetch_recent_articles()
+            if not articles:
+                # Don't keep serving an empty (likely failed) fetch from cache
+                fetch_recent_articles.clear()
+            st.session_state.sampled_articles = sample_articles(articles)
 
-            if sampled_articles:
-                st.success(
-                    "Recent articles retrieved successfully! Click the 'Fetch' button again to change the articles."
-                )
-                articles_container = st.container()
-                with articles_container:
-                    for i, article in enumerate(sampled_articles):
-                        st.markdown(
-                            f"**{i+1}. {article['title']}** "
-                            f"({article['published_date']}; [source]({article['href']}))"
-                        )
-            else:
+            if not st.session_state.sampled_articles:
                 st.warning("No articles found. Please try again in a few moments.")
         st.session_state.articles_retrieved = True
 
-    input_container = st.container()
-    with input_container:
-        st.divider()
-        st.subheader("Search")
-
-        # Select the search mode
-        search_mode = st.radio(
-            "Select search mode",
-            ["Conversational", "Overview", "Traditional"],
-        )
-
-        if search_mode in ["Overview", "Traditional"]:
-            location = st.text_input(
-                "Enter a location for the search",
-                help="Enter a city to mimic real search behavior.",
-            )
-
-        query = st.text_input(
-            "Enter a search query",
-            help="Use this as you would a normal Goole search.",
+    # Render from session state so other widgets' reruns keep the articles
+    sampled_articles = st.session_state.sampled_articles
+    if sampled_articles:
+        st.success(
+            "Recent articles retrieved successfully! Click the 'Fetch' button again to change the articles."
         )
-
-        st.divider()
-        if query:
-            st.subheader("Search Results")
-
-        # TODO: Need to allow conversation to continue
-        if query and search_mode == "Conversational":
-            conversational_container = st.container()
-            with st.spinner("Searching Google..."):
-
-                # Conversational Search
-                grounded_response = grounded_generation(
-                    client=google_client, model="gemini-2.0-flash", prompt=query
-                )
-                response_data = grounded_response.candidates[0]
-                updated_text = update_response_text(
-                    response_data.content.parts[0].text,
-                    response_data.grounding_metadata.grounding_supports,
-                    response_data.grounding_metadata.grounding_chunks,
+        articles_container = st.container()
+        with articles_container:
+            # One markdown element for all articles rather than one per article
+            st.markdown(
+                "\n\n".join(
+                    f"**{i+1}. {article['title']}** "
+                    f"({article['published_date']}; [source]({article['href']}))"
+                    for i, article in enumerate(sampled_articles)
                 )
+            )
 
-                with conversational_container:
-                    st.subheader("Conversational Search")
-                    if updated_text:
-                        st.write(updated_text)
-
-        # TODO: Implement
-        elif query and search_mode == "Overview":
-            st.write("Nothing implemented here.")
-            pass
-
-        # TODO: Need to handle infinite scrolling via pagination
-        elif query and search_mode == "Traditional":
+    search_panel(google_client, serp_api_key)
 
-            with st.spinner("Searching Google..."):
-                search_results = get_search_results(query, location, serp_api_key)
-                formatted_results = organic_search_to_markdown(
-                    search_results["organic_results"]
-                )
-                if formatted_results:
-                    st.write(formatted_results)
-                else:
-                    st.warning(
-                        "No search results found. Please try again in a few moments."
-                    )
+    # Only poll while a search is in flight, so idle sessions don't rerun
+    if _search_pending():
+        poll_search()
 
 
 if __name__ == "__main__":